@@ -5,6 +5,13 @@ from typing import Dict
 # Root directory since we flattened the structure
 LIB_DIRS = ["."]
 
+WORKFLOW_PREFIXES = (
+    ".github/workflows",
+    ".github/tools",
+    ".github/actions",
+    ".github/scripts/check_diff.py",
+)
+
 if __name__ == "__main__":
     files = sys.argv[1:]
 
@@ -27,17 +34,13 @@ if __name__ == "__main__":
             dirs_to_run["test"].add(".")
 
         # For workflow changes, run tests
-        if any(
-            file.startswith(dir_)
-            for dir_ in (
-                ".github/workflows",
-                ".github/tools",
-                ".github/actions",
-                ".github/scripts/check_diff.py",
-            )
-        ):
+        if file.startswith(WORKFLOW_PREFIXES):
             dirs_to_run["test"].update(LIB_DIRS)
 
+        # Everything is already scheduled, so later files cannot change the output
+        if dirs_to_run["test"].issuperset(LIB_DIRS):
+            break
+
     outputs = {
         "dirs-to-lint": list(dirs_to_run["lint"] | dirs_to_run["test"]),
         "dirs-to-test": list(dirs_to_run["test"]),
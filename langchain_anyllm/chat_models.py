@@ -6,15 +6,21 @@ enabling seamless integration with LangChain's ecosystem.
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import logging
+import types
+import weakref
 from typing import (
     Any,
     AsyncIterator,
     Callable,
     Iterator,
+    Self,
     Sequence,
 )
 
-from any_llm import acompletion, completion
+from any_llm import AnyLLM
 from any_llm.types.completion import ChatCompletion, ChatCompletionChunk
 from langchain_core.callbacks import (
     AsyncCallbackManagerForLLMRun,
@@ -34,17 +40,101 @@ from langchain_core.messages import (
 )
 from langchain_core.messages.ai import UsageMetadata
 from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
-from langchain_core.runnables import Runnable
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import merge_configs
 from langchain_core.tools import BaseTool
 from langchain_core.utils.function_calling import convert_to_openai_tool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from langchain_anyllm.utils import (
     _convert_delta_to_message_chunk,
     _convert_dict_to_message,
-    _convert_message_to_dict,
+    _convert_messages_to_dicts,
 )
 
+logger = logging.getLogger(__name__)
+
+# LangChain tool_choice values that OpenAI-compatible APIs spell differently.
+# LangChain uses 'any' where OpenAI uses 'required'.
+_TOOL_CHOICE_MAP: dict[str | bool, str] = {
+    "any": "required",
+    True: "required",
+    False: "none",
+}
+
+# Maximum time content-only deltas are held back when ``coalesce_stream`` is set.
+_COALESCE_WINDOW_SECONDS = 0.005
+
+
+async def _with_flush_ticks(
+    chunks: AsyncIterator[Any], flush_due: Callable[[], float | None]
+) -> AsyncIterator[Any]:
+    """Yield from ``chunks``, or None whenever the flush deadline passes first.
+
+    ``flush_due`` returns the seconds left until buffered content must be
+    flushed, or None when nothing is buffered. The pending read is never
+    cancelled on a deadline, so no chunk is lost while the stream stalls.
+    """
+    iterator = aiter(chunks)
+    pending: asyncio.Future[Any] | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(iterator))
+            due = flush_due()
+            if due is not None:
+                done, _ = await asyncio.wait({pending}, timeout=max(due, 0))
+                if not done:
+                    yield None
+                    continue
+            try:
+                chunk = await pending
+            except StopAsyncIteration:
+                return
+            pending = None
+            yield chunk
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _is_content_only(message_chunk: BaseMessageChunk) -> bool:
+    """Whether a chunk carries nothing but string content."""
+    return (
+        type(message_chunk) is AIMessageChunk
+        and isinstance(message_chunk.content, str)
+        and not message_chunk.additional_kwargs
+        and not message_chunk.tool_call_chunks
+    )
+
+
+# OpenAI schemas of tools bound so far, keyed by ``id(tool)``. Only classes and
+# plain functions are cached: dicts and BaseTool instances are routinely edited
+# in place between binds. Entries hold a weak reference whose callback evicts the
+# entry once the tool is collected; that also keeps a recycled id from hitting.
+_TOOL_SCHEMA_CACHE: dict[int, tuple[weakref.ref[Any], dict[str, Any]]] = {}
+
+
+def _convert_to_openai_tool_cached(
+    tool: dict[str, Any] | type[BaseModel] | Callable[..., Any] | BaseTool,
+) -> dict[str, Any]:
+    """Convert a tool to the OpenAI format, reusing earlier conversions."""
+    if not isinstance(tool, (type, types.FunctionType)):
+        return convert_to_openai_tool(tool)
+
+    key = id(tool)
+    entry = _TOOL_SCHEMA_CACHE.get(key)
+    if entry is not None and entry[0]() is tool:
+        return copy.deepcopy(entry[1])
+
+    schema = convert_to_openai_tool(tool)
+
+    def _evict(_: weakref.ref[Any]) -> None:
+        _TOOL_SCHEMA_CACHE.pop(key, None)
+
+    _TOOL_SCHEMA_CACHE[key] = (weakref.ref(tool, _evict), schema)
+    return copy.deepcopy(schema)
+
 
 class ChatAnyLLM(BaseChatModel):
     """Chat model that uses the AnyLLM API."""
@@ -53,6 +143,45 @@ class ChatAnyLLM(BaseChatModel):
     api_key: str | None = None
     api_base: str | None = None
     model_kwargs: dict[str, Any] = Field(default_factory=dict)
+    # Merge content-only deltas arriving within a few milliseconds of each other
+    # into one chunk in async streaming, trading granularity for fewer callbacks.
+    coalesce_stream: bool = False
+    # Default cap on in-flight requests for abatch_limited; keep it below the
+    # provider's rate limit.
+    max_concurrency: int = Field(default=10, gt=0)
+    # HTTP client handed to the provider SDK, e.g. an ``httpx.AsyncClient`` for
+    # OpenAI-compatible providers, to tune pooling, keep-alive or HTTP/2. Its
+    # connections are bound to the loop that first uses them, so call the model
+    # either synchronously or from a single event loop.
+    http_client: Any | None = Field(default=None, exclude=True)
+
+    # Provider clients, built on first request rather than at construction. Sync
+    # calls all run on any-llm's long-lived runner loop and share one client;
+    # async SDK clients hold connections bound to an event loop, so each loop
+    # gets its own, dropped once that loop is closed. Entries are stored with the
+    # settings they were built from.
+    _sync_client: tuple[tuple[Any, ...], AnyLLM] | None = PrivateAttr(default=None)
+    _async_clients: dict[asyncio.AbstractEventLoop, tuple[tuple[Any, ...], AnyLLM]] = (
+        PrivateAttr(default_factory=dict)
+    )
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        # Provider clients hold locks and sockets that cannot be copied; the copy
+        # builds its own on first use
+        memo = {} if memo is None else memo
+        memo[id(self._sync_client)] = None
+        memo[id(self._async_clients)] = {}
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        if state["__pydantic_private__"]:
+            state["__pydantic_private__"] = {
+                **state["__pydantic_private__"],
+                "_sync_client": None,
+                "_async_clients": {},
+            }
+        return state
 
     def _generate(
         self,
@@ -63,26 +192,30 @@ class ChatAnyLLM(BaseChatModel):
         **kwargs: Any,
     ) -> ChatResult:
         if stream:
-            stream_iter = self._stream(
-                messages, stop=stop, run_manager=run_manager, **kwargs
-            )
-            return generate_from_stream(stream_iter)
+            if run_manager is not None:
+                stream_iter = self._stream(
+                    messages, stop=stop, run_manager=run_manager, **kwargs
+                )
+                return generate_from_stream(stream_iter)
+            # Nobody observes the tokens, so streaming would only be aggregated
+            logger.debug("No run manager to stream to; using a single completion")
 
-        message_dicts = [_convert_message_to_dict(m) for m in messages]
+        message_dicts = _convert_messages_to_dicts(messages)
         params = self._create_params(stop, **kwargs)
-        response = completion(messages=message_dicts, **params)  # type: ignore[arg-type]
+        client = self._get_client(params)
+        response = client.completion(messages=message_dicts, **params)  # type: ignore[arg-type]
         if not isinstance(response, ChatCompletion):
             error_message = f"Expected ChatCompletion, got {type(response)}"
             raise ValueError(error_message)
         return self._create_chat_result(response)
 
     def _create_chat_result(self, response: ChatCompletion) -> ChatResult:
-        resp_dict = response.model_dump()
-
         generations = []
         token_usage = response.usage
-        for res in resp_dict["choices"]:
-            message = _convert_dict_to_message(res["message"])
+        # Only the messages are dumped; the rest of the response is read through
+        # attribute access to avoid materializing the whole ChatCompletion tree.
+        for choice in response.choices:
+            message = _convert_dict_to_message(choice.message.model_dump())
             if isinstance(message, AIMessage) and token_usage:
                 message.response_metadata = {"model_name": self.model}
                 message.usage_metadata = UsageMetadata(
@@ -93,7 +226,7 @@ class ChatAnyLLM(BaseChatModel):
                 )
             gen = ChatGeneration(
                 message=message,
-                generation_info={"finish_reason": res.get("finish_reason")},
+                generation_info={"finish_reason": choice.finish_reason},
             )
             generations.append(gen)
 
@@ -118,27 +251,73 @@ class ChatAnyLLM(BaseChatModel):
                 raise ValueError(error_message)
             params["stop"] = stop
 
+        if not kwargs:
+            return params
+
         # Translate LangChain tool_choice to OpenAI-compatible values
         # Only include tool_choice if tools are present
-        if "tool_choice" in kwargs and "tools" in kwargs:
-            tool_choice = kwargs["tool_choice"]
-            if tool_choice == "any":
-                # LangChain uses 'any', OpenAI uses 'required'
-                params["tool_choice"] = "required"
-            elif tool_choice is True:
-                params["tool_choice"] = "required"
-            elif tool_choice is False:
-                params["tool_choice"] = "none"
-            else:
+        if "tool_choice" in kwargs:
+            tool_choice = kwargs.pop("tool_choice")
+            if "tools" in kwargs:
+                if isinstance(tool_choice, (str, bool)):
+                    tool_choice = _TOOL_CHOICE_MAP.get(tool_choice, tool_choice)
                 params["tool_choice"] = tool_choice
 
-        # Pass through all kwargs except our special handling
-        for key, value in kwargs.items():
-            if key not in ["tool_choice"]:
-                params[key] = value
-
+        # Pass through all remaining kwargs
+        params.update(kwargs)
         return params
 
+    def _get_client(
+        self,
+        params: dict[str, Any],
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> AnyLLM:
+        """Return the provider client for a request, building it on first use.
+
+        Client settings are popped from ``params`` and ``model`` is replaced with
+        the provider's model id, leaving only the completion arguments.
+        """
+        model = params.pop("model")
+        provider = params.pop("provider", None)
+        if provider is None:
+            provider_key, params["model"] = AnyLLM.split_model_provider(model)
+        else:
+            provider_key = AnyLLM.resolve_provider_key(provider)
+            params["model"] = model
+        api_key = params.pop("api_key", None)
+        api_base = params.pop("api_base", None)
+        client_kwargs: dict[str, Any] = {}
+        if self.http_client is not None:
+            client_kwargs["http_client"] = self.http_client
+        client_args = params.pop("client_args", None)
+        if client_args:
+            # Arbitrary client arguments cannot be compared reliably; don't cache
+            return AnyLLM.create(
+                provider_key,
+                api_key=api_key,
+                api_base=api_base,
+                **{**client_kwargs, **client_args},
+            )
+
+        key = (provider_key, api_key, api_base, self.http_client)
+        if loop is not None:
+            # Clients of closed loops can never be used again, and their sockets
+            # keep the loop alive, so they must be released explicitly
+            for cached_loop in list(self._async_clients):
+                if cached_loop.is_closed():
+                    self._async_clients.pop(cached_loop, None)
+        cached = self._sync_client if loop is None else self._async_clients.get(loop)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        client = AnyLLM.create(
+            provider_key, api_key=api_key, api_base=api_base, **client_kwargs
+        )
+        if loop is None:
+            self._sync_client = (key, client)
+        else:
+            self._async_clients[loop] = (key, client)
+        return client
+
     def _stream(
         self,
         messages: list[BaseMessage],
@@ -146,22 +325,23 @@ class ChatAnyLLM(BaseChatModel):
         run_manager: CallbackManagerForLLMRun | None = None,
         **kwargs: Any,
     ) -> Iterator[ChatGenerationChunk]:
-        message_dicts = [_convert_message_to_dict(m) for m in messages]
+        message_dicts = _convert_messages_to_dicts(messages)
         params = self._create_params(stop, **kwargs)
         params["stream"] = True
 
         default_chunk_class: type[BaseMessageChunk] = AIMessageChunk
-        result = completion(messages=message_dicts, **params)  # type: ignore[arg-type]
-        if not isinstance(result, Iterator):
+        client = self._get_client(params)
+        result = client.completion(messages=message_dicts, **params)  # type: ignore[arg-type]
+        if isinstance(result, ChatCompletion) or not hasattr(result, "__next__"):
             error_message = f"Expected Iterator, got {type(result)}"
             raise ValueError(error_message)
 
         # Iterate over stream results
         for chunk_item in result:
-            chunk_dict: dict[str, Any] = chunk_item.model_dump()
-            if len(chunk_dict["choices"]) == 0:
+            choices = chunk_item.choices
+            if not choices:
                 continue
-            delta = chunk_dict["choices"][0]["delta"]
+            delta = choices[0].delta
             message_chunk = _convert_delta_to_message_chunk(delta, default_chunk_class)
             default_chunk_class = message_chunk.__class__
             cg_chunk = ChatGenerationChunk(message=message_chunk)
@@ -178,16 +358,39 @@ class ChatAnyLLM(BaseChatModel):
         run_manager: AsyncCallbackManagerForLLMRun | None = None,
         **kwargs: Any,
     ) -> AsyncIterator[ChatGenerationChunk]:
-        message_dicts = [_convert_message_to_dict(m) for m in messages]
+        message_dicts = _convert_messages_to_dicts(messages)
         params = self._create_params(stop, **kwargs)
         params["stream"] = True
 
         default_chunk_class: type[BaseMessageChunk] = AIMessageChunk
-        result = await acompletion(messages=message_dicts, **params)  # type: ignore[arg-type]
-        if not isinstance(result, AsyncIterator):
+        client = self._get_client(params, asyncio.get_running_loop())
+        result = await client.acompletion(messages=message_dicts, **params)  # type: ignore[arg-type]
+        if isinstance(result, ChatCompletion) or not hasattr(result, "__anext__"):
             error_message = f"Expected AsyncIterator, got {type(result)}"
             raise ValueError(error_message)
-        async for stream_chunk in result:
+
+        # Content-only deltas buffered while coalescing
+        buffer: list[str] = []
+        loop = asyncio.get_running_loop()
+        last_flush = loop.time()
+
+        def flush_due() -> float | None:
+            if not buffer:
+                return None
+            return _COALESCE_WINDOW_SECONDS - (loop.time() - last_flush)
+
+        chunks = (
+            _with_flush_ticks(result, flush_due) if self.coalesce_stream else result
+        )
+        async for stream_chunk in chunks:
+            if stream_chunk is None:
+                # The stream stalled with content buffered past the window
+                yield await self._aemit_chunk(
+                    AIMessageChunk(content="".join(buffer)), run_manager
+                )
+                buffer.clear()
+                last_flush = loop.time()
+                continue
             if not isinstance(stream_chunk, ChatCompletionChunk):
                 error_message = "Unexpected chunk type"
                 raise ValueError(error_message)
@@ -197,12 +400,39 @@ class ChatAnyLLM(BaseChatModel):
                     delta, default_chunk_class
                 )
                 default_chunk_class = message_chunk.__class__
-                cg_chunk = ChatGenerationChunk(message=message_chunk)
-                if run_manager:
-                    content = message_chunk.content
-                    if isinstance(content, str):
-                        await run_manager.on_llm_new_token(content, chunk=cg_chunk)
-                yield cg_chunk
+                if (
+                    self.coalesce_stream
+                    and choice.finish_reason is None
+                    and _is_content_only(message_chunk)
+                ):
+                    buffer.append(message_chunk.content)  # type: ignore[arg-type]
+                    if loop.time() - last_flush < _COALESCE_WINDOW_SECONDS:
+                        continue
+                    message_chunk = AIMessageChunk(content="".join(buffer))
+                    buffer.clear()
+                elif buffer:
+                    yield await self._aemit_chunk(
+                        AIMessageChunk(content="".join(buffer)), run_manager
+                    )
+                    buffer.clear()
+                yield await self._aemit_chunk(message_chunk, run_manager)
+                last_flush = loop.time()
+        if buffer:
+            yield await self._aemit_chunk(
+                AIMessageChunk(content="".join(buffer)), run_manager
+            )
+
+    async def _aemit_chunk(
+        self,
+        message_chunk: BaseMessageChunk,
+        run_manager: AsyncCallbackManagerForLLMRun | None,
+    ) -> ChatGenerationChunk:
+        cg_chunk = ChatGenerationChunk(message=message_chunk)
+        if run_manager:
+            content = message_chunk.content
+            if isinstance(content, str):
+                await run_manager.on_llm_new_token(content, chunk=cg_chunk)
+        return cg_chunk
 
     async def _agenerate(
         self,
@@ -214,19 +444,98 @@ class ChatAnyLLM(BaseChatModel):
     ) -> ChatResult:
         should_stream = stream if stream is not None else False
         if should_stream:
-            stream_iter = self._astream(
-                messages=messages, stop=stop, run_manager=run_manager, **kwargs
-            )
-            return await agenerate_from_stream(stream_iter)
+            if run_manager is not None:
+                stream_iter = self._astream(
+                    messages=messages, stop=stop, run_manager=run_manager, **kwargs
+                )
+                return await agenerate_from_stream(stream_iter)
+            # Nobody observes the tokens, so streaming would only be aggregated
+            logger.debug("No run manager to stream to; using a single completion")
 
-        message_dicts = [_convert_message_to_dict(m) for m in messages]
+        message_dicts = _convert_messages_to_dicts(messages)
         params = self._create_params(stop, **kwargs)
-        response = await acompletion(messages=message_dicts, **params)  # type: ignore[arg-type]
+        client = self._get_client(params, asyncio.get_running_loop())
+        response = await client.acompletion(messages=message_dicts, **params)  # type: ignore[arg-type]
         if not isinstance(response, ChatCompletion):
             error_message = f"Expected ChatCompletion, got {type(response)}"
             raise ValueError(error_message)
         return self._create_chat_result(response)
 
+    def raw_invoke(self, prompt: str, **kwargs: Any) -> str:
+        """Send a single user prompt straight to any-llm and return the reply text.
+
+        Skips LangChain's callbacks, caching and config handling, which is
+        useful for isolating client-side overhead from network time.
+
+        Args:
+            prompt: The user message to send
+            **kwargs: Additional arguments passed to the completion call
+
+        Returns:
+            The content of the first choice
+        """
+        params = self._create_params(**kwargs)
+        client = self._get_client(params)
+        response = client.completion(
+            messages=[{"role": "user", "content": prompt}], **params
+        )
+        if not isinstance(response, ChatCompletion):
+            error_message = f"Expected ChatCompletion, got {type(response)}"
+            raise ValueError(error_message)
+        return response.choices[0].message.content or ""
+
+    async def raw_ainvoke(self, prompt: str, **kwargs: Any) -> str:
+        """Async version of ``raw_invoke``."""
+        params = self._create_params(**kwargs)
+        client = self._get_client(params, asyncio.get_running_loop())
+        response = await client.acompletion(
+            messages=[{"role": "user", "content": prompt}], **params
+        )
+        if not isinstance(response, ChatCompletion):
+            error_message = f"Expected ChatCompletion, got {type(response)}"
+            raise ValueError(error_message)
+        return response.choices[0].message.content or ""
+
+    async def abatch_limited(
+        self,
+        inputs: Sequence[LanguageModelInput],
+        max_concurrency: int | None = None,
+        config: RunnableConfig | Sequence[RunnableConfig] | None = None,
+        **kwargs: Any,
+    ) -> list[AIMessage]:
+        """Invoke the model on many inputs concurrently, with bounded concurrency.
+
+        Args:
+            inputs: Inputs to invoke the model on
+            max_concurrency: Maximum number of requests in flight at once.
+                Defaults to ``max_concurrency`` from ``config``, then to the
+                ``max_concurrency`` field.
+            config: Config for the invocations, as in ``abatch``. The resolved
+                ``max_concurrency`` is merged into it.
+            **kwargs: Additional arguments passed to each invocation
+
+        Returns:
+            Responses in the same order as ``inputs``
+
+        Raises:
+            ValueError: If ``max_concurrency`` is less than 1
+        """
+        configs = list(config) if isinstance(config, Sequence) else [config]
+        limit = max_concurrency
+        if limit is None and configs and configs[0] is not None:
+            limit = configs[0].get("max_concurrency")
+        if limit is None:
+            limit = self.max_concurrency
+        if limit < 1:
+            error_message = f"max_concurrency must be at least 1, got {limit}"
+            raise ValueError(error_message)
+        merged = [merge_configs(c, {"max_concurrency": limit}) for c in configs]
+        return await self.abatch(
+            list(inputs),
+            config=merged if isinstance(config, Sequence) else merged[0],
+            **kwargs,
+        )
+
     def bind_tools(
         self,
         tools: Sequence[
@@ -236,7 +545,7 @@ class ChatAnyLLM(BaseChatModel):
         **kwargs: Any,
     ) -> Runnable[LanguageModelInput, AIMessage]:
         """Bind tool-like objects to this chat model."""
-        formatted_tools = [convert_to_openai_tool(tool) for tool in tools]
+        formatted_tools = [_convert_to_openai_tool_cached(tool) for tool in tools]
         return super().bind(tools=formatted_tools, tool_choice=tool_choice, **kwargs)
 
     @property
@@ -5,7 +5,8 @@ from __future__ import annotations
 
 import json
 import logging
-from collections.abc import Mapping
+import re
+from collections.abc import Callable, Mapping, Sequence
 from typing import Any
 
 from langchain_core.messages import (
@@ -26,9 +27,151 @@ from langchain_core.messages import (
     ToolMessage,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+# orjson parses integers beyond 64 bits as floats, losing precision, so inputs
+# containing a digit run that long are left to the stdlib parser
+_LONG_DIGIT_RUN = re.compile(r"\d{20}")
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when it is installed.
+
+    Falls back to :func:`json.loads` when orjson could lose precision on a long
+    integer or rejects input the stdlib accepts (e.g. ``NaN``), so the result is
+    always what :func:`json.loads` would return.
+    """
+    if orjson is not None:
+        text = data.decode() if isinstance(data, bytes) else data
+        if not _LONG_DIGIT_RUN.search(text):
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when it is installed.
+
+    Falls back to :func:`json.dumps` for values orjson cannot encode, such as
+    integers beyond 64 bits. Unlike the stdlib, orjson writes ``NaN`` and
+    infinities as ``null``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj)
+
+
+def _as_dict(value: Any) -> dict[str, Any]:
+    """Return ``value`` itself if it is a plain dict, else a dict copy of it.
+
+    Converted dicts come from freshly dumped responses or deltas, so taking
+    ownership of them is safe and saves a copy per message or chunk.
+    """
+    if type(value) is dict:
+        return value
+    return dict(value)
+
+
+def _parse_tool_call(tool_call: Mapping[str, Any]) -> ToolCall | None:
+    """Parse an OpenAI-format tool call, or return None if it is malformed."""
+    try:
+        return ToolCall(
+            name=tool_call["function"]["name"],
+            args=_json_loads(tool_call["function"]["arguments"]),
+            id=tool_call.get("id"),
+        )
+    except (KeyError, json.JSONDecodeError) as e:
+        logger.debug(f"Skipping malformed tool call: {e}")
+        return None
+
+
+def _parse_tool_call_chunk(rtc: Any) -> ToolCallChunk | None:
+    """Parse a streamed tool call delta, or return None if it is unusable."""
+    try:
+        if isinstance(rtc, dict):
+            func = rtc.get("function")
+            if func and isinstance(func, dict):
+                return ToolCallChunk(
+                    name=func.get("name") or "",
+                    args=func.get("arguments") or "",
+                    id=rtc.get("id"),
+                    index=rtc.get("index"),
+                )
+        else:
+            # Handle object-style tool call
+            func = getattr(rtc, "function", None)
+            if func:
+                return ToolCallChunk(
+                    name=getattr(func, "name", None) or "",
+                    args=getattr(func, "arguments", None) or "",
+                    id=getattr(rtc, "id", None),
+                    index=getattr(rtc, "index", None),
+                )
+    except (KeyError, AttributeError, TypeError) as e:
+        # This handles malformed tool call chunks in streaming
+        logger.debug(f"Skipping malformed tool call chunk: {e}")
+    return None
+
+
+def _user_from_dict(_dict: Mapping[str, Any], content: Any) -> BaseMessage:
+    return HumanMessage(content=content)
+
+
+def _assistant_from_dict(_dict: Mapping[str, Any], content: Any) -> BaseMessage:
+    additional_kwargs = {}
+    function_call = _dict.get("function_call")
+    if function_call:
+        additional_kwargs["function_call"] = _as_dict(function_call)
+
+    tool_calls = []
+    raw_tool_calls = _dict.get("tool_calls")
+    if raw_tool_calls:
+        additional_kwargs["tool_calls"] = raw_tool_calls
+        tool_calls = [
+            tc for tc in map(_parse_tool_call, raw_tool_calls) if tc is not None
+        ]
+
+    return AIMessage(
+        content=content, additional_kwargs=additional_kwargs, tool_calls=tool_calls
+    )
+
+
+def _system_from_dict(_dict: Mapping[str, Any], content: Any) -> BaseMessage:
+    return SystemMessage(content=content)
+
+
+def _function_from_dict(_dict: Mapping[str, Any], content: Any) -> BaseMessage:
+    return FunctionMessage(content=content, name=_dict["name"])
+
+
+def _tool_from_dict(_dict: Mapping[str, Any], content: Any) -> BaseMessage:
+    return ToolMessage(content=content, tool_call_id=_dict["tool_call_id"])
+
+
+def _chat_from_dict(_dict: Mapping[str, Any], content: Any) -> BaseMessage:
+    return ChatMessage(content=content, role=_dict["role"] or "unknown")
+
+
+_ROLE_TO_MESSAGE: dict[str, Callable[[Mapping[str, Any], Any], BaseMessage]] = {
+    "user": _user_from_dict,
+    "assistant": _assistant_from_dict,
+    "system": _system_from_dict,
+    "function": _function_from_dict,
+    "tool": _tool_from_dict,
+}
+
+
 def _convert_dict_to_message(_dict: Mapping[str, Any]) -> BaseMessage:
     """Convert a dictionary to a LangChain message.
 
@@ -39,45 +182,9 @@ def _convert_dict_to_message(_dict: Mapping[str, Any]) -> BaseMessage:
         Appropriate BaseMessage subclass based on role
     """
     role = _dict["role"]
-    if role == "user":
-        return HumanMessage(content=_dict["content"])
-    if role == "assistant":
-        # Handle content - can be string, None, or missing
-        # When tool calls are present, content might be None
-        content = _dict.get("content") or ""
-
-        additional_kwargs = {}
-        if _dict.get("function_call"):
-            additional_kwargs["function_call"] = dict(_dict["function_call"])
-
-        tool_calls = []
-        if _dict.get("tool_calls"):
-            additional_kwargs["tool_calls"] = _dict["tool_calls"]
-            for tool_call in _dict["tool_calls"]:
-                try:
-                    tool_calls.append(
-                        ToolCall(
-                            name=tool_call["function"]["name"],
-                            args=json.loads(tool_call["function"]["arguments"]),
-                            id=tool_call.get("id"),
-                        )
-                    )
-                except (KeyError, json.JSONDecodeError) as e:
-                    logger.debug(f"Skipping malformed tool call: {e}")
-                    continue
-
-        return AIMessage(
-            content=content, additional_kwargs=additional_kwargs, tool_calls=tool_calls
-        )
-    if role == "system":
-        return SystemMessage(content=_dict["content"])
-    if role == "function":
-        return FunctionMessage(content=_dict["content"], name=_dict["name"])
-    if role == "tool":
-        return ToolMessage(content=_dict["content"], tool_call_id=_dict["tool_call_id"])
-    if not role:
-        return ChatMessage(content=_dict["content"], role="unknown")
-    return ChatMessage(content=_dict["content"], role=role)
+    # Content can be None or missing, e.g. when tool calls are present
+    content = _dict.get("content") or ""
+    return _ROLE_TO_MESSAGE.get(role, _chat_from_dict)(_dict, content)
 
 
 def _convert_delta_to_message_chunk(
@@ -92,23 +199,39 @@ def _convert_delta_to_message_chunk(
     Returns:
         Appropriate BaseMessageChunk subclass
     """
-    # Handle both dict and object-style deltadi
-    if isinstance(delta, dict):
-        role = delta.get("role")
-        content = delta.get("content") or ""
-        function_call = delta.get("function_call")
-        raw_tool_calls = delta.get("tool_calls")
-        reasoning = delta.get("reasoning")
-    else:
+    # Handle both object-style deltas (what the streaming loops pass) and dicts
+    if not isinstance(delta, dict):
         role = getattr(delta, "role", None)
         content = getattr(delta, "content", None) or ""
         function_call = getattr(delta, "function_call", None)
         raw_tool_calls = getattr(delta, "tool_calls", None)
         reasoning = getattr(delta, "reasoning", None)
+        if raw_tool_calls:
+            # Keep additional_kwargs JSON-like so chunks merge by tool call index
+            raw_tool_calls = [
+                rtc.model_dump() if hasattr(rtc, "model_dump") else rtc
+                for rtc in raw_tool_calls
+            ]
+    else:
+        role = delta.get("role")
+        content = delta.get("content") or ""
+        function_call = delta.get("function_call")
+        raw_tool_calls = delta.get("tool_calls")
+        reasoning = delta.get("reasoning")
+
+    # Most streamed deltas carry nothing but assistant content
+    if (
+        default_class is AIMessageChunk
+        and not function_call
+        and not raw_tool_calls
+        and not reasoning
+        and (role is None or role == "assistant")
+    ):
+        return AIMessageChunk(content=content)
 
     additional_kwargs: dict[str, Any] = {}
     if function_call:
-        additional_kwargs["function_call"] = dict(function_call)
+        additional_kwargs["function_call"] = _as_dict(function_call)
 
     if reasoning:
         reasoning_content = (
@@ -122,36 +245,11 @@ def _convert_delta_to_message_chunk(
     tool_call_chunks = []
     if raw_tool_calls:
         additional_kwargs["tool_calls"] = raw_tool_calls
-        for rtc in raw_tool_calls:
-            try:
-                if isinstance(rtc, dict):
-                    func = rtc.get("function")
-                    if func and isinstance(func, dict):
-                        tool_call_chunks.append(
-                            ToolCallChunk(
-                                name=func.get("name") or "",
-                                args=func.get("arguments") or "",
-                                id=rtc.get("id"),
-                                index=rtc.get("index"),
-                            )
-                        )
-                else:
-                    # Handle object-style tool call
-                    func = getattr(rtc, "function", None)
-                    if func:
-                        tool_call_chunks.append(
-                            ToolCallChunk(
-                                name=getattr(func, "name", None) or "",
-                                args=getattr(func, "arguments", None) or "",
-                                id=getattr(rtc, "id", None),
-                                index=getattr(rtc, "index", None),
-                            )
-                        )
-            except (KeyError, AttributeError, TypeError) as e:
-                # Log the error but continue processing other tool calls
-                # This handles malformed tool call chunks in streaming
-                logger.debug(f"Skipping malformed tool call chunk: {e}")
-                continue
+        tool_call_chunks = [
+            tcc
+            for tcc in map(_parse_tool_call_chunk, raw_tool_calls)
+            if tcc is not None
+        ]
 
     if role == "user" or default_class == HumanMessageChunk:
         return HumanMessageChunk(content=content)
@@ -194,11 +292,60 @@ def _lc_tool_call_to_openai_tool_call(tool_call: ToolCall) -> dict[str, Any]:
         "id": tool_call["id"],
         "function": {
             "name": tool_call["name"],
-            "arguments": json.dumps(tool_call["args"]),
+            "arguments": _json_dumps(tool_call["args"]),
         },
     }
 
 
+def _chat_to_dict(message: Any, message_dict: dict[str, Any]) -> None:
+    message_dict["role"] = message.role
+
+
+def _human_to_dict(message: Any, message_dict: dict[str, Any]) -> None:
+    message_dict["role"] = "user"
+
+
+def _ai_to_dict(message: Any, message_dict: dict[str, Any]) -> None:
+    message_dict["role"] = "assistant"
+    if "function_call" in message.additional_kwargs:
+        message_dict["function_call"] = message.additional_kwargs["function_call"]
+    if message.tool_calls:
+        message_dict["tool_calls"] = [
+            _lc_tool_call_to_openai_tool_call(tc) for tc in message.tool_calls
+        ]
+    elif "tool_calls" in message.additional_kwargs:
+        message_dict["tool_calls"] = message.additional_kwargs["tool_calls"]
+
+
+def _system_to_dict(message: Any, message_dict: dict[str, Any]) -> None:
+    message_dict["role"] = "system"
+
+
+def _function_to_dict(message: Any, message_dict: dict[str, Any]) -> None:
+    message_dict["role"] = "function"
+    message_dict["name"] = message.name
+
+
+def _tool_to_dict(message: Any, message_dict: dict[str, Any]) -> None:
+    message_dict["role"] = "tool"
+    message_dict["tool_call_id"] = message.tool_call_id
+
+
+# Exact message type -> handler filling in the role-specific keys. Insertion
+# order matters: it is the isinstance order used for subclasses that miss the
+# exact-type lookup.
+_MESSAGE_TO_DICT_HANDLERS: dict[
+    type[BaseMessage], Callable[[Any, dict[str, Any]], None]
+] = {
+    ChatMessage: _chat_to_dict,
+    HumanMessage: _human_to_dict,
+    AIMessage: _ai_to_dict,
+    SystemMessage: _system_to_dict,
+    FunctionMessage: _function_to_dict,
+    ToolMessage: _tool_to_dict,
+}
+
+
 def _convert_message_to_dict(message: BaseMessage) -> dict[str, Any]:
     """Convert a LangChain message to a dictionary.
 
@@ -211,32 +358,30 @@ def _convert_message_to_dict(message: BaseMessage) -> dict[str, Any]:
     Raises:
         ValueError: If message type is unknown
     """
+    handler = _MESSAGE_TO_DICT_HANDLERS.get(type(message))
+    if handler is None:
+        for message_type, candidate in _MESSAGE_TO_DICT_HANDLERS.items():
+            if isinstance(message, message_type):
+                handler = candidate
+                break
+        else:
+            error_message = f"Got unknown type {message}"
+            raise ValueError(error_message)
+
     message_dict: dict[str, Any] = {"content": message.content}
-    if isinstance(message, ChatMessage):
-        message_dict["role"] = message.role
-    elif isinstance(message, HumanMessage):
-        message_dict["role"] = "user"
-    elif isinstance(message, AIMessage):
-        message_dict["role"] = "assistant"
-        if "function_call" in message.additional_kwargs:
-            message_dict["function_call"] = message.additional_kwargs["function_call"]
-        if message.tool_calls:
-            message_dict["tool_calls"] = [
-                _lc_tool_call_to_openai_tool_call(tc) for tc in message.tool_calls
-            ]
-        elif "tool_calls" in message.additional_kwargs:
-            message_dict["tool_calls"] = message.additional_kwargs["tool_calls"]
-    elif isinstance(message, SystemMessage):
-        message_dict["role"] = "system"
-    elif isinstance(message, FunctionMessage):
-        message_dict["role"] = "function"
-        message_dict["name"] = message.name
-    elif isinstance(message, ToolMessage):
-        message_dict["role"] = "tool"
-        message_dict["tool_call_id"] = message.tool_call_id
-    else:
-        error_message = f"Got unknown type {message}"
-        raise ValueError(error_message)
+    handler(message, message_dict)
     if "name" in message.additional_kwargs:
         message_dict["name"] = message.additional_kwargs["name"]
     return message_dict
+
+
+def _convert_messages_to_dicts(messages: Sequence[BaseMessage]) -> list[dict[str, Any]]:
+    """Convert a list of LangChain messages to dictionaries.
+
+    Args:
+        messages: LangChain message objects, e.g. a full chat history
+
+    Returns:
+        Dictionary representations of the messages, in order
+    """
+    return [_convert_message_to_dict(m) for m in messages]
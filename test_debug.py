@@ -1,38 +1,111 @@
 """Debug script to test ChatAnyLLM with actual API calls.
 
 Run with: OPENAI_API_KEY=your-key uv run python test_debug.py
+
+Set ANYLLM_DEBUG_CACHE=path/to/cache.json to reuse responses from earlier runs
+instead of calling the API again. Leave it unset to always hit the API.
+
+Set ANYLLM_DEBUG_RAW=1 to run the basic invoke check through raw_ainvoke,
+which skips LangChain's Runnable plumbing, to separate its overhead from
+network time.
 """
 
+import asyncio
+import json
 import os
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import messages_from_dict, messages_to_dict
+from langchain_core.outputs import ChatGeneration, Generation
+from langchain_core.tools import tool
+
 from langchain_anyllm import ChatAnyLLM
-from langchain_core.messages import HumanMessage
 
-def test_basic_invoke():
+
+class JSONFileCache(BaseCache):
+    """Exact-match response cache persisted to a JSON file.
+
+    Entries are keyed on the serialized prompt and the model parameters
+    (model name and model_kwargs), so changing either is a cache miss.
+
+    BaseCache runs the async methods in executor threads, so writes are
+    serialized through a lock.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, Any]
+        try:
+            with open(path) as f:
+                self._entries = json.load(f)
+        except FileNotFoundError:
+            self._entries = {}
+
+    def lookup(self, prompt: str, llm_string: str) -> list[Generation] | None:
+        entry = self._entries.get(f"{llm_string}\n{prompt}")
+        if entry is None:
+            return None
+        generations: list[Generation] = [
+            ChatGeneration(message=m) for m in messages_from_dict(entry)
+        ]
+        return generations
+
+    def update(
+        self, prompt: str, llm_string: str, return_val: Sequence[Generation]
+    ) -> None:
+        messages = [g.message for g in return_val if isinstance(g, ChatGeneration)]
+        entry = messages_to_dict(messages)
+        with self._lock:
+            self._entries[f"{llm_string}\n{prompt}"] = entry
+            self._save()
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+    def _save(self) -> None:
+        """Write a snapshot of the entries to disk. Call with the lock held."""
+        snapshot = dict(self._entries)
+        with open(self.path, "w") as f:
+            json.dump(snapshot, f)
+
+
+STREAM_MIN_BATCH_SIZE = 1
+STREAM_BATCH_GROWTH = 3
+STREAM_MAX_BATCH_SIZE = 50
+
+CACHE = (
+    JSONFileCache(os.environ["ANYLLM_DEBUG_CACHE"])
+    if os.environ.get("ANYLLM_DEBUG_CACHE")
+    else None
+)
+
+RAW_INVOKE = bool(os.environ.get("ANYLLM_DEBUG_RAW"))
+
+async def test_basic_invoke(llm):
     """Test basic invocation."""
     print("Testing basic invoke...")
-    llm = ChatAnyLLM(
-        model="openai:gpt-4o-mini",
-        model_kwargs={"temperature": 0},
-    )
-
-    result = llm.invoke("Say 'Hello'")
-    print(f"Result type: {type(result)}")
-    print(f"Result content: {result.content}")
-    print(f"Content length: {len(result.content)}")
-    print(f"Content type: {type(result.content)}")
-    assert result.content, "Content is empty!"
-    assert isinstance(result.content, str), "Content is not a string!"
+    if RAW_INVOKE:
+        content = await llm.raw_ainvoke("Say 'Hello'")
+    else:
+        result = await llm.ainvoke("Say 'Hello'")
+        print(f"Result type: {type(result)}")
+        content = result.content
+    print(f"Result content: {content}")
+    print(f"Content length: {len(content)}")
+    print(f"Content type: {type(content)}")
+    assert content, "Content is empty!"
+    assert isinstance(content, str), "Content is not a string!"
     print("✅ Basic invoke test passed\n")
 
-def test_tool_calling():
+async def test_tool_calling(llm):
     """Test tool calling."""
     print("Testing tool calling...")
-    llm = ChatAnyLLM(
-        model="openai:gpt-4o-mini",
-        model_kwargs={"temperature": 0},
-    )
-
-    from langchain_core.tools import tool
 
     @tool
     def get_weather(city: str) -> str:
@@ -40,7 +113,7 @@ def test_tool_calling():
         return f"Weather in {city}: Sunny"
 
     llm_with_tools = llm.bind_tools([get_weather])
-    result = llm_with_tools.invoke("What's the weather in Paris?")
+    result = await llm_with_tools.ainvoke("What's the weather in Paris?")
 
     print(f"Result type: {type(result)}")
     print(f"Result content: {result.content}")
@@ -48,23 +121,49 @@ def test_tool_calling():
     print(f"Additional kwargs: {result.additional_kwargs}")
     print("✅ Tool calling test passed\n")
 
-def test_streaming():
+async def test_streaming(llm):
     """Test streaming."""
     print("Testing streaming...")
+    # Print in batches that start small (so the first tokens show up right
+    # away) and grow up to STREAM_MAX_BATCH_SIZE chunks per write.
+    parts = []
+    pending = []
+    total_chunks = 0
+    batch_size = STREAM_MIN_BATCH_SIZE
+    async for chunk in llm.astream("Count to 3"):
+        total_chunks += 1
+        content = chunk.content
+        if not isinstance(content, str):
+            # Multimodal chunks carry a list of content blocks
+            content = str(content)
+        if not content:
+            continue
+        pending.append(content)
+        if len(pending) >= batch_size:
+            print("".join(pending), end="", flush=True)
+            parts.extend(pending)
+            pending.clear()
+            batch_size = min(batch_size * STREAM_BATCH_GROWTH, STREAM_MAX_BATCH_SIZE)
+    print("".join(pending), end="", flush=True)
+    parts.extend(pending)
+
+    print(f"\n\nTotal chunks: {total_chunks}")
+    full_content = "".join(parts)
+    print(f"Full content: {full_content}")
+    print("✅ Streaming test passed\n")
+
+async def main():
+    """Run the debug tests concurrently against one shared model."""
     llm = ChatAnyLLM(
         model="openai:gpt-4o-mini",
         model_kwargs={"temperature": 0},
+        cache=CACHE,
+    )
+    await asyncio.gather(
+        test_basic_invoke(llm),
+        test_tool_calling(llm),
+        test_streaming(llm),
     )
-
-    chunks = []
-    for chunk in llm.stream("Count to 3"):
-        chunks.append(chunk)
-        print(f"Chunk: {chunk.content}", end="", flush=True)
-
-    print(f"\n\nTotal chunks: {len(chunks)}")
-    full_content = "".join(str(chunk.content) for chunk in chunks)
-    print(f"Full content: {full_content}")
-    print("✅ Streaming test passed\n")
 
 if __name__ == "__main__":
     if not os.environ.get("OPENAI_API_KEY"):
@@ -72,9 +171,7 @@ if __name__ == "__main__":
         exit(1)
 
     try:
-        test_basic_invoke()
-        test_tool_calling()
-        test_streaming()
+        asyncio.run(main())
         print("\n✅ All debug tests passed!")
     except Exception as e:
         print(f"\n❌ Test failed with error: {e}")
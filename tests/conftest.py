@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from langchain_anyllm import ChatAnyLLM
+
+
+@pytest.fixture(scope="session")
+def chat_llm() -> ChatAnyLLM:
+    """A default ChatAnyLLM shared by tests that do not customize the model."""
+    return ChatAnyLLM(model="gpt-4")
@@ -124,6 +124,17 @@ class TestChatAnyLLMStandard(ChatModelIntegrationTests):
         return True
 
 
+async def test_abatch_limited() -> None:
+    """Fan out many prompts with a bounded number of requests in flight."""
+    llm = ChatAnyLLM(
+        model="openai:gpt-4o-mini", model_kwargs={"temperature": 0}, max_concurrency=5
+    )
+    prompts = [f"Reply with the number {i} and nothing else." for i in range(20)]
+    results = await llm.abatch_limited(prompts)
+    assert len(results) == len(prompts)
+    assert all(isinstance(result.content, str) for result in results)
+
+
 # Skip tests if no API key is available
 pytestmark = pytest.mark.skipif(
     not os.environ.get("OPENAI_API_KEY"),
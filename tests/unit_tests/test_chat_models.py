@@ -1,11 +1,72 @@
 """Test ChatAnyLLM chat model."""
 
+import asyncio
+import copy
+import pickle
+from typing import Any, AsyncIterator
+
+import httpx
 import pytest
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from any_llm.types.completion import ChatCompletion, ChatCompletionChunk
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+)
+from pydantic import ValidationError
+from pytest_mock import MockerFixture
 
 from langchain_anyllm import ChatAnyLLM
 
 
+def _patch_create(mocker: MockerFixture) -> Any:
+    """Patch any-llm client creation and return the mocked ``AnyLLM.create``."""
+    create = mocker.patch("langchain_anyllm.chat_models.AnyLLM.create")
+    create.return_value.acompletion = mocker.AsyncMock()
+    return create
+
+
+def _make_completion(content: str) -> ChatCompletion:
+    return ChatCompletion.model_validate(
+        {
+            "id": "chatcmpl-123",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4},
+        }
+    )
+
+
+def _make_chunk(
+    delta: dict[str, Any], finish_reason: str | None = None
+) -> ChatCompletionChunk:
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4",
+            "choices": [{"index": 0, "finish_reason": finish_reason, "delta": delta}],
+        }
+    )
+
+
+async def _aiter_chunks(
+    chunks: list[ChatCompletionChunk],
+) -> AsyncIterator[ChatCompletionChunk]:
+    for chunk in chunks:
+        yield chunk
+
+
 class TestChatAnyLLM:
     """Test ChatAnyLLM class."""
 
@@ -31,27 +92,75 @@ class TestChatAnyLLM:
         params2 = llm2._create_params()
         assert params2["n"] == 2
 
+    def test_tool_choice_params(self, chat_llm: ChatAnyLLM) -> None:
+        """Test tool_choice is translated and only sent alongside tools."""
+        tools = [{"type": "function", "function": {"name": "f"}}]
+        named = {"type": "function", "function": {"name": "f"}}
+        for tool_choice, expected in [
+            ("any", "required"),
+            (True, "required"),
+            (False, "none"),
+            ("auto", "auto"),
+            (named, named),
+        ]:
+            params = chat_llm._create_params(tools=tools, tool_choice=tool_choice)
+            assert params["tool_choice"] == expected
+        assert "tool_choice" not in chat_llm._create_params(tool_choice="any")
+
     @pytest.mark.asyncio
-    async def test_async_initialization(self) -> None:
+    async def test_async_initialization(self, chat_llm: ChatAnyLLM) -> None:
         """Test async functionality exists."""
-        llm = ChatAnyLLM(model="gpt-4")
         # Just verify the async methods exist
-        assert hasattr(llm, "ainvoke")
-        assert hasattr(llm, "astream")
-        assert hasattr(llm, "_agenerate")
+        assert hasattr(chat_llm, "ainvoke")
+        assert hasattr(chat_llm, "astream")
+        assert hasattr(chat_llm, "_agenerate")
 
-    def test_bind_tools(self) -> None:
+    def test_bind_tools(self, chat_llm: ChatAnyLLM) -> None:
         """Test binding tools to model."""
-        llm = ChatAnyLLM(model="gpt-4")
 
         def dummy_tool(x: int) -> int:
             """Dummy tool."""
             return x * 2
 
-        llm_with_tools = llm.bind_tools([dummy_tool])
+        llm_with_tools = chat_llm.bind_tools([dummy_tool])
         assert llm_with_tools is not None
 
-    def test_with_structured_output(self) -> None:
+    def test_bind_tools_reuses_schema(
+        self, mocker: MockerFixture, chat_llm: ChatAnyLLM
+    ) -> None:
+        """Test binding the same tool twice converts its schema once."""
+        from langchain_anyllm import chat_models
+
+        convert = mocker.spy(chat_models, "convert_to_openai_tool")
+
+        def dummy_tool(x: int) -> int:
+            """Dummy tool."""
+            return x * 2
+
+        first = chat_llm.bind_tools([dummy_tool])
+        second = chat_llm.bind_tools([dummy_tool])
+        assert convert.call_count == 1
+        first_tools = first.kwargs["tools"]  # type: ignore[attr-defined]
+        second_tools = second.kwargs["tools"]  # type: ignore[attr-defined]
+        assert first_tools == second_tools
+        assert first_tools[0] is not second_tools[0]
+
+    def test_bind_tools_sees_edited_base_tool(self, chat_llm: ChatAnyLLM) -> None:
+        """Test a BaseTool edited in place between binds is converted again."""
+        from langchain_core.tools import tool
+
+        @tool
+        def get_weather(location: str) -> str:
+            """Get the weather for a location."""
+            return f"Sunny in {location}"
+
+        chat_llm.bind_tools([get_weather])
+        get_weather.description = "CHANGED"
+        bound = chat_llm.bind_tools([get_weather])
+        tools = bound.kwargs["tools"]  # type: ignore[attr-defined]
+        assert tools[0]["function"]["description"] == "CHANGED"
+
+    def test_with_structured_output(self, chat_llm: ChatAnyLLM) -> None:
         """Test structured output binding."""
         from pydantic import BaseModel
 
@@ -60,6 +169,206 @@ class TestChatAnyLLM:
             name: str
             age: int
 
-        llm = ChatAnyLLM(model="gpt-4")
-        structured_llm = llm.with_structured_output(TestSchema)
+        structured_llm = chat_llm.with_structured_output(TestSchema)
         assert structured_llm is not None
+
+    def test_create_chat_result(self, chat_llm: ChatAnyLLM) -> None:
+        """Test converting a ChatCompletion into a ChatResult."""
+        response = _make_completion("Hello")
+        result = chat_llm._create_chat_result(response)
+        generation = result.generations[0]
+        assert isinstance(generation.message, AIMessage)
+        assert generation.message.content == "Hello"
+        assert generation.message.usage_metadata == {
+            "input_tokens": 3,
+            "output_tokens": 1,
+            "total_tokens": 4,
+        }
+        assert generation.generation_info == {"finish_reason": "stop"}
+
+    def test_client_created_lazily(self, mocker: MockerFixture) -> None:
+        """Test the provider client is built on first request and then reused."""
+        create = _patch_create(mocker)
+        create.return_value.completion.return_value = _make_completion("Hello")
+        llm = ChatAnyLLM(model="openai:gpt-4", api_key="test-key")
+        create.assert_not_called()
+
+        llm.invoke("Hi")
+        llm.invoke("Hi again")
+        create.assert_called_once_with("openai", api_key="test-key", api_base=None)
+        call_kwargs = create.return_value.completion.call_args.kwargs
+        assert call_kwargs["model"] == "gpt-4"
+        assert "api_key" not in call_kwargs
+
+    async def test_async_client_per_event_loop(self, mocker: MockerFixture) -> None:
+        """Test async calls reuse a client within a loop but not across loops."""
+        create = _patch_create(mocker)
+        create.return_value.acompletion.return_value = _make_completion("Hello")
+        llm = ChatAnyLLM(model="openai:gpt-4")
+        await llm.ainvoke("Hi")
+        await llm.ainvoke("Hi again")
+        assert create.call_count == 1
+
+        await asyncio.to_thread(asyncio.run, llm.ainvoke("Hi"))
+        assert create.call_count == 2
+
+    def test_async_clients_of_closed_loops_released(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test clients cached for closed event loops are dropped."""
+        create = _patch_create(mocker)
+        create.return_value.acompletion.return_value = _make_completion("Hello")
+        llm = ChatAnyLLM(model="openai:gpt-4")
+        for _ in range(5):
+            asyncio.run(llm.ainvoke("Hi"))
+        assert create.call_count == 5
+        assert len(llm._async_clients) == 1
+
+    async def test_copy_and_pickle_after_use(self) -> None:
+        """Test a model that has built clients can still be deep-copied and pickled."""
+        llm = ChatAnyLLM(model="openai:gpt-4", api_key="test-key")
+        llm._get_client(llm._create_params())
+        llm._get_client(llm._create_params(), asyncio.get_running_loop())
+
+        for copied in (copy.deepcopy(llm), pickle.loads(pickle.dumps(llm))):
+            assert copied.model == "openai:gpt-4"
+            assert copied._sync_client is None
+            assert copied._async_clients == {}
+        assert llm._sync_client is not None
+
+    async def test_custom_http_client(self, mocker: MockerFixture) -> None:
+        """Test a custom HTTP client is passed to the provider client."""
+        create = _patch_create(mocker)
+        create.return_value.acompletion.return_value = _make_completion("Hello")
+        async with httpx.AsyncClient() as http_client:
+            llm = ChatAnyLLM(model="openai:gpt-4", http_client=http_client)
+            assert llm.http_client is http_client
+            await llm.ainvoke("Hi")
+        create.assert_called_once_with(
+            "openai", api_key=None, api_base=None, http_client=http_client
+        )
+
+    def test_generate_stream_without_run_manager(self, mocker: MockerFixture) -> None:
+        """Test stream=True without a run manager makes a single completion."""
+        completion = _patch_create(mocker).return_value.completion
+        completion.return_value = _make_completion("Hello")
+        llm = ChatAnyLLM(model="openai:gpt-4")
+        result = llm._generate([HumanMessage(content="Hi")], stream=True)
+        assert result.generations[0].message.content == "Hello"
+        assert "stream" not in completion.call_args.kwargs
+
+    async def test_raw_invoke(self, mocker: MockerFixture) -> None:
+        """Test raw_invoke and raw_ainvoke return the reply text."""
+        create = _patch_create(mocker)
+        create.return_value.completion.return_value = _make_completion("Hello")
+        create.return_value.acompletion.return_value = _make_completion("Hi")
+        llm = ChatAnyLLM(model="openai:gpt-4", model_kwargs={"temperature": 0})
+        assert llm.raw_invoke("Say hello") == "Hello"
+        assert await llm.raw_ainvoke("Say hi") == "Hi"
+        call_kwargs = create.return_value.acompletion.call_args.kwargs
+        assert call_kwargs["messages"] == [{"role": "user", "content": "Say hi"}]
+        assert call_kwargs["temperature"] == 0
+
+    def test_stream(self, mocker: MockerFixture) -> None:
+        """Test streaming chunks are converted to message chunks."""
+        chunks = [
+            _make_chunk({"role": "assistant", "content": "Hel"}),
+            _make_chunk({"content": "lo"}),
+            _make_chunk(
+                {
+                    "tool_calls": [
+                        {
+                            "index": 0,
+                            "id": "call_123",
+                            "type": "function",
+                            "function": {"name": "get_weather", "arguments": "{}"},
+                        }
+                    ]
+                }
+            ),
+        ]
+        _patch_create(mocker).return_value.completion.return_value = iter(chunks)
+        llm = ChatAnyLLM(model="openai:gpt-4")
+        result = list(llm.stream("Hi"))
+        assert all(isinstance(chunk, AIMessageChunk) for chunk in result)
+        merged = result[0] + result[1] + result[2]
+        assert merged.content == "Hello"
+        assert merged.tool_calls[0]["name"] == "get_weather"
+        assert merged.additional_kwargs["tool_calls"][0]["id"] == "call_123"
+
+    async def test_astream_coalesce(self, mocker: MockerFixture) -> None:
+        """Test content-only deltas are merged when coalescing is enabled."""
+        chunks = [
+            _make_chunk({"role": "assistant", "content": "Hel"}),
+            _make_chunk({"content": "lo"}),
+            _make_chunk({}, finish_reason="stop"),
+        ]
+        acompletion = _patch_create(mocker).return_value.acompletion
+        acompletion.return_value = _aiter_chunks(chunks)
+        mocker.patch("langchain_anyllm.chat_models._COALESCE_WINDOW_SECONDS", 60)
+        llm = ChatAnyLLM(model="openai:gpt-4", coalesce_stream=True)
+        result = [chunk async for chunk in llm.astream("Hi")]
+        assert result[0].content == "Hello"
+        assert all(chunk.content == "" for chunk in result[1:])
+
+    async def test_astream_coalesce_flushes_stalled_stream(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test buffered deltas are flushed when the stream stalls past the window."""
+
+        async def stalling_chunks() -> AsyncIterator[ChatCompletionChunk]:
+            yield _make_chunk({"role": "assistant", "content": "Hel"})
+            yield _make_chunk({"content": "lo"})
+            await asyncio.sleep(0.5)
+            yield _make_chunk({"content": " world"})
+            yield _make_chunk({}, finish_reason="stop")
+
+        acompletion = _patch_create(mocker).return_value.acompletion
+        acompletion.return_value = stalling_chunks()
+        mocker.patch("langchain_anyllm.chat_models._COALESCE_WINDOW_SECONDS", 0.05)
+        llm = ChatAnyLLM(model="openai:gpt-4", coalesce_stream=True)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        received = []
+        async for chunk in llm.astream("Hi"):
+            received.append((chunk.text, loop.time() - start))
+        assert received[0][0] == "Hello"
+        assert received[0][1] < 0.4
+        assert "".join(content for content, _ in received) == "Hello world"
+
+    async def test_abatch_limited(self, mocker: MockerFixture) -> None:
+        """Test abatch_limited never exceeds the concurrency limit."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_acompletion(**kwargs: Any) -> ChatCompletion:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_completion("Hello")
+
+        acompletion = _patch_create(mocker).return_value.acompletion
+        acompletion.side_effect = fake_acompletion
+        llm = ChatAnyLLM(model="openai:gpt-4", max_concurrency=3)
+        results = await llm.abatch_limited([f"Prompt {i}" for i in range(10)])
+        assert [r.content for r in results] == ["Hello"] * 10
+        assert peak == 3
+
+    async def test_abatch_limited_config(self, mocker: MockerFixture) -> None:
+        """Test abatch_limited merges max_concurrency into a caller's config."""
+        acompletion = _patch_create(mocker).return_value.acompletion
+        acompletion.return_value = _make_completion("Hello")
+        abatch = mocker.spy(ChatAnyLLM, "abatch")
+        llm = ChatAnyLLM(model="openai:gpt-4", max_concurrency=3)
+        results = await llm.abatch_limited(["Hi"], config={"tags": ["batch"]})
+        assert [r.content for r in results] == ["Hello"]
+        config = abatch.call_args.kwargs["config"]
+        assert config["tags"] == ["batch"]
+        assert config["max_concurrency"] == 3
+
+    def test_max_concurrency_must_be_positive(self) -> None:
+        """Test a max_concurrency that would block every request is rejected."""
+        with pytest.raises(ValidationError):
+            ChatAnyLLM(model="openai:gpt-4", max_concurrency=0)
@@ -1,17 +1,28 @@
 """Test utility functions."""
 
+import json
+import math
+
 import pytest
 from langchain_core.messages import (
     AIMessage,
     AIMessageChunk,
+    ChatMessage,
     HumanMessage,
+    HumanMessageChunk,
     SystemMessage,
+    ToolCall,
     ToolMessage,
 )
 
+from langchain_anyllm import utils
 from langchain_anyllm.utils import (
+    _convert_delta_to_message_chunk,
     _convert_dict_to_message,
     _convert_message_to_dict,
+    _convert_messages_to_dicts,
+    _json_dumps,
+    _json_loads,
     _lc_tool_call_to_openai_tool_call,
 )
 
@@ -103,3 +114,125 @@ class TestMessageConversion:
         result = _convert_dict_to_message(message_dict)
         assert isinstance(result, AIMessage)
         assert result.content == ""
+
+    def test_convert_message_subclass_to_dict(self) -> None:
+        """Test subclasses fall back to their parent message's conversion."""
+        message = AIMessageChunk(content="Hi there")
+        result = _convert_message_to_dict(message)
+        assert result == {"role": "assistant", "content": "Hi there"}
+
+    def test_convert_dict_to_chat_message(self) -> None:
+        """Test converting dicts with unrecognized roles to ChatMessage."""
+        result = _convert_dict_to_message({"role": "critic", "content": "Meh"})
+        assert isinstance(result, ChatMessage)
+        assert result.role == "critic"
+
+        result = _convert_dict_to_message({"role": "", "content": "Meh"})
+        assert isinstance(result, ChatMessage)
+        assert result.role == "unknown"
+
+    def test_tool_call_arguments_round_trip(self) -> None:
+        """Test tool call arguments survive serialization and parsing."""
+        tool_call = ToolCall(
+            id="call_123",
+            name="get_weather",
+            args={"location": "Paris", "days": [1, 2]},
+        )
+        openai_tool_call = _lc_tool_call_to_openai_tool_call(tool_call)
+        result = _convert_dict_to_message(
+            {"role": "assistant", "content": None, "tool_calls": [openai_tool_call]}
+        )
+        assert isinstance(result, AIMessage)
+        assert result.tool_calls[0]["args"] == tool_call["args"]
+
+    def test_convert_delta_to_message_chunk(self) -> None:
+        """Test converting streaming deltas to message chunks."""
+        result = _convert_delta_to_message_chunk({"content": "Hi"}, AIMessageChunk)
+        assert isinstance(result, AIMessageChunk)
+        assert result.content == "Hi"
+        assert result.additional_kwargs == {}
+
+        result = _convert_delta_to_message_chunk(
+            {"role": "user", "content": "Hi"}, AIMessageChunk
+        )
+        assert isinstance(result, HumanMessageChunk)
+
+        result = _convert_delta_to_message_chunk(
+            {"content": None, "function_call": {"name": "f", "arguments": ""}},
+            AIMessageChunk,
+        )
+        assert result.additional_kwargs["function_call"]["name"] == "f"
+
+    def test_convert_dict_skips_malformed_tool_calls(self) -> None:
+        """Test malformed tool calls are dropped while valid ones are kept."""
+        message_dict = {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {"id": "call_1", "function": {"name": "f", "arguments": "{not json"}},
+                {"id": "call_2", "function": {"arguments": "{}"}},
+                {"id": "call_3", "function": {"name": "g", "arguments": "{}"}},
+            ],
+        }
+        result = _convert_dict_to_message(message_dict)
+        assert isinstance(result, AIMessage)
+        assert [tc["id"] for tc in result.tool_calls] == ["call_3"]
+
+    def test_convert_dict_to_tool_message_with_empty_content(self) -> None:
+        """Test converting a tool dict with None content."""
+        message_dict = {"role": "tool", "content": None, "tool_call_id": "call_123"}
+        result = _convert_dict_to_message(message_dict)
+        assert isinstance(result, ToolMessage)
+        assert result.content == ""
+        assert result.tool_call_id == "call_123"
+
+    def test_convert_messages_to_dicts(self) -> None:
+        """Test converting a chat history preserves order and roles."""
+        messages = [
+            SystemMessage(content="You are helpful"),
+            HumanMessage(content="Hello"),
+            AIMessage(content="Hi there"),
+        ]
+        result = _convert_messages_to_dicts(messages)
+        assert [m["role"] for m in result] == ["system", "user", "assistant"]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    """Run a test with orjson installed and with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
+class TestJSONHelpers:
+    """Test the JSON helpers behave like the stdlib with either backend."""
+
+    def test_round_trip(self, json_backend: str) -> None:
+        """Test ordinary values survive encoding and decoding."""
+        value = {"location": "Paris", "days": [1, 2], "ratio": 0.5, "ok": True}
+        assert json.loads(_json_dumps(value)) == value
+        assert _json_loads(json.dumps(value)) == value
+
+    def test_dumps_integer_beyond_64_bits(self, json_backend: str) -> None:
+        """Test integers orjson cannot encode fall back to the stdlib."""
+        assert json.loads(_json_dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_loads_integer_beyond_64_bits(self, json_backend: str) -> None:
+        """Test long integers are parsed exactly rather than as floats."""
+        assert _json_loads('{"n": 123456789012345678901234}') == {
+            "n": 123456789012345678901234
+        }
+
+    def test_loads_nan(self, json_backend: str) -> None:
+        """Test input only the stdlib accepts is still parsed."""
+        assert math.isnan(_json_loads('{"x": NaN}')["x"])
+
+    def test_loads_invalid(self, json_backend: str) -> None:
+        """Test invalid input raises the stdlib's error type."""
+        with pytest.raises(json.JSONDecodeError):
+            _json_loads("{not json")